@@ -1,67 +1,123 @@
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
-from sklearn.model_selection import train_test_split
+import pandas as pd
 from sklearn.ensemble import RandomForestRegressor
 from nba_api.stats.endpoints import PlayerGameLog, TeamGameLog, LeagueDashTeamStats
 from nba_api.stats.static import players, teams
-import random
+from nba_api.stats.library.http import NBAStatsHTTP
+
+# Number of concurrent stats.nba.com fetches issued by predict_many
+_FETCH_WORKERS = 8
+
+# Share one keep-alive session across every endpoint call, with enough pooled connections for the fetch workers
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=_FETCH_WORKERS))
+NBAStatsHTTP.set_session(_session)
+
+# Name -> static record indices, built once at import instead of scanning per call
+_PLAYERS_BY_NAME = {p['full_name'].lower(): p for p in players.get_players()}
+_TEAMS_BY_NAME = {t['full_name'].lower(): t for t in teams.get_teams()}
+
+# Game logs are cached per (id, season, season type); callers get a copy they can mutate
+@functools.lru_cache(maxsize=None)
+def _fetch_player_game_log(player_id, season, season_type="Regular Season"):
+    return PlayerGameLog(player_id=player_id, season=season, season_type_all_star=season_type).get_data_frames()[0]
+
+@functools.lru_cache(maxsize=None)
+def _fetch_team_game_log(team_id, season, season_type="Regular Season"):
+    return TeamGameLog(team_id=team_id, season=season, season_type_all_star=season_type).get_data_frames()[0]
+
+def get_player_game_log(player_id, season, season_type="Regular Season"):
+    return _fetch_player_game_log(player_id, season, season_type).copy()
+
+def get_team_game_log(team_id, season, season_type="Regular Season"):
+    return _fetch_team_game_log(team_id, season, season_type).copy()
 
 # Fetch league-wide averages for better scaling
 def get_league_averages():
     league_stats = LeagueDashTeamStats(season="2024-25", season_type_all_star="Regular Season").get_data_frames()[0]
-    league_avg_def_rtg = league_stats['PTS'].mean()
-    league_avg_steals = league_stats['STL'].mean()
-    league_avg_blocks = league_stats['BLK'].mean()
-    league_avg_turnovers = league_stats['TOV'].mean()
+    league_avg_def_rtg, league_avg_steals, league_avg_blocks, league_avg_turnovers = league_stats[['PTS', 'STL', 'BLK', 'TOV']].to_numpy(dtype=np.float64).mean(axis=0)
     return league_avg_def_rtg, league_avg_steals, league_avg_blocks, league_avg_turnovers
 
-# Function to retrieve player home and away performance
+# Function to retrieve player home and away performance (memoized per player and season)
+@functools.lru_cache(maxsize=128)
 def get_player_home_away_stats(player_name, season='2024-25'):
-    player_dict = players.get_players()
-    player = next((p for p in player_dict if p['full_name'].lower() == player_name.lower()), None)
+    player = _PLAYERS_BY_NAME.get(player_name.lower())
     if not player:
         raise ValueError(f"Player {player_name} not found.")
     player_id = player['id']
     
-    game_log = PlayerGameLog(player_id=player_id, season=season).get_data_frames()[0]
-    game_log['Location'] = game_log['MATCHUP'].apply(lambda x: 'Home' if 'vs.' in x else 'Away')
+    game_log = get_player_game_log(player_id, season)
+    is_home = game_log['MATCHUP'].str.contains('vs.', regex=False)
     
-    home_stats = game_log[game_log['Location'] == 'Home'].mean(numeric_only=True)
-    away_stats = game_log[game_log['Location'] == 'Away'].mean(numeric_only=True)
+    location_means = game_log.groupby(is_home).mean(numeric_only=True).reindex([True, False])
+    home_stats, away_stats = location_means.loc[True], location_means.loc[False]
     
     return home_stats, away_stats
 
-# Function to retrieve opponent's home/away defensive performance
+# Function to retrieve opponent's home/away defensive performance (memoized per team and season)
+@functools.lru_cache(maxsize=128)
 def get_opponent_home_away_defense(opponent_team, season='2024-25'):
-    opponent = [t for t in teams.get_teams() if t['full_name'].lower() == opponent_team.lower()]
+    opponent = _TEAMS_BY_NAME.get(opponent_team.lower())
     if not opponent:
         raise ValueError(f"Opponent team {opponent_team} not found.")
-    opponent_id = opponent[0]['id']
+    opponent_id = opponent['id']
     
-    opponent_games = TeamGameLog(team_id=opponent_id, season=season).get_data_frames()[0]
-    opponent_games['Location'] = opponent_games['MATCHUP'].apply(lambda x: 'Home' if 'vs.' in x else 'Away')
+    opponent_games = get_team_game_log(opponent_id, season)
+    is_home = opponent_games['MATCHUP'].str.contains('vs.', regex=False)
     
-    home_defense = opponent_games[opponent_games['Location'] == 'Home'].mean(numeric_only=True)
-    away_defense = opponent_games[opponent_games['Location'] == 'Away'].mean(numeric_only=True)
+    location_means = opponent_games.groupby(is_home).mean(numeric_only=True).reindex([True, False])
+    home_defense, away_defense = location_means.loc[True], location_means.loc[False]
     
     return home_defense, away_defense
 
+# When the caches were last emptied; nothing cached can be older than this
+_caches_cleared_at = time.monotonic()
+
+# Function to drop the cached game logs and home/away splits so the next prediction fetches fresh stats
+def clear_caches():
+    global _caches_cleared_at
+    for cached in (_fetch_player_game_log, _fetch_team_game_log, get_player_home_away_stats, get_opponent_home_away_defense):
+        cached.cache_clear()
+    _caches_cleared_at = time.monotonic()
+
+# Function to clear the caches once they may hold stats older than max_age seconds
+def expire_caches(max_age):
+    if time.monotonic() - _caches_cleared_at > max_age:
+        clear_caches()
+
+# Function to scale simulated predictions by the matchup adjustment and game volatility (hot or cold games), in place
+def apply_adjustments(predictions, adjustment):
+    game_variance = np.random.random(predictions.size)
+    hot = game_variance < 0.15
+    cold = (game_variance > 0.15) & (game_variance < 0.25)
+    predictions *= adjustment
+    predictions[hot] *= np.random.uniform(1.2, 1.4, hot.sum())
+    predictions[cold] *= np.random.uniform(0.6, 0.8, cold.sum())
+    return predictions
+
 # Function to predict player stats with weighted recent games and improved defensive & home/away impact
 def predict_weighted_player_stat(player_name, stat, opponent_team, home_game, n_estimators=200, simulations=100, weight_recent=1.2, defense_weight=0.7):
-    player = [p for p in players.get_players() if p['full_name'].lower() == player_name.lower()]
+    player = _PLAYERS_BY_NAME.get(player_name.lower())
     if not player:
         raise ValueError(f"Player {player_name} not found.")
-    player_id = player[0]['id']
-    player_games = PlayerGameLog(player_id=player_id, season="2024-25", season_type_all_star="Regular Season").get_data_frames()[0]
+    player_id = player['id']
+    player_games = get_player_game_log(player_id, "2024-25", "Regular Season")
     
-    # Ensure sorting is done correctly to get the full season stats
-    player_games = player_games.sort_values(by='GAME_DATE', ascending=False)
-    player_games['MIN'] = player_games['MIN'].astype(str).apply(lambda x: float(x.split(':')[0]) if ':' in x else float(x))
-    stats = ['PTS', 'REB', 'AST', 'MIN', 'FGA', 'FGM', 'FG3A', 'FG3M', 'FTA', 'FTM', 'STL', 'BLK', 'TOV']
-    full_season_games = player_games[stats].to_dict(orient='list')
+    # Newest games first (sample_weight below relies on it); GAME_DATE is text like "APR 13, 2025",
+    # so sort on the parsed date rather than the string
+    player_games = player_games.sort_values(by='GAME_DATE', ascending=False,
+                                            key=lambda dates: pd.to_datetime(dates, format='%b %d, %Y'))
+    player_games['MIN'] = pd.to_numeric(player_games['MIN'].astype(str).str.split(':', n=1).str[0], errors='coerce')
+    features = ['MIN', 'FGA', 'FGM', 'FG3A', 'FG3M', 'FTA', 'FTM', 'STL', 'BLK', 'TOV']
     
-    X = np.array([full_season_games['MIN'], full_season_games['FGA'], full_season_games['FGM'], full_season_games['FG3A'], full_season_games['FG3M'], full_season_games['FTA'], full_season_games['FTM'], full_season_games['STL'], full_season_games['BLK'], full_season_games['TOV']]).T
-    y = np.array(full_season_games[stat])
+    # Trees split on float32 internally, so build X in that dtype to avoid a cast inside fit
+    X = player_games[features].to_numpy(dtype=np.float32)
+    y = player_games[stat].to_numpy(dtype=np.float64)
     
     if len(X) < 10:
         raise ValueError(f"Not enough data for reliable prediction for {player_name}.")
@@ -78,20 +134,39 @@ def predict_weighted_player_stat(player_name, stat, opponent_team, home_game, n_
     home_away_adjustment = (home_stats[stat] / away_stats[stat]) if home_game else (away_stats[stat] / home_stats[stat])
     home_away_adjustment = max(0.95, min(1.1, home_away_adjustment))  # Ensure realistic home advantage
     
-    simulation_results = []
-    for _ in range(simulations):
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=None)
-        model = RandomForestRegressor(n_estimators=n_estimators, random_state=None)
-        model.fit(X_train, y_train)
-        predicted_stat = model.predict([X.mean(axis=0)])[0] * defense_adjustment * home_away_adjustment
-        
-        # Factor in game volatility (hot or cold games)
-        game_variance = random.random()
-        if game_variance < 0.15:
-            predicted_stat *= random.uniform(1.2, 1.4)
-        elif game_variance < 0.25 and game_variance > 0.15:
-            predicted_stat *= random.uniform(0.6, 0.8)
-        
-        simulation_results.append(predicted_stat)
+    # Upweight the most recent games through sample_weight rather than duplicating rows
+    sample_weight = np.ones(len(X))
+    sample_weight[:5] = weight_recent
+    
+    # Fit a single forest; every tree is already a bootstrap model, so sampling per-tree
+    # predictions gives the simulation spread without refitting the forest each time
+    model = RandomForestRegressor(n_estimators=n_estimators, n_jobs=-1, random_state=None)
+    model.fit(X, y, sample_weight=sample_weight)
+    # Trees are queried directly with a prevalidated float32 row, skipping per-tree input checks
+    X_mean = np.ascontiguousarray(X.mean(axis=0, dtype=np.float32).reshape(1, -1))
+    tree_predictions = np.fromiter((tree.predict(X_mean, check_input=False)[0] for tree in model.estimators_),
+                                   dtype=np.float64, count=len(model.estimators_))
+    adjustment = defense_adjustment * home_away_adjustment
     
-    return np.percentile(simulation_results,50), simulation_results
+    # The point estimate is the forest prediction (mean over trees); the sampled per-tree
+    # draws only supply the spread
+    prediction = tree_predictions.mean() * adjustment
+    
+    base_predictions = np.random.choice(tree_predictions, size=simulations)
+    simulation_results = apply_adjustments(base_predictions, adjustment)
+    
+    return prediction, simulation_results
+
+# Function to predict several (player, stat, opponent, home_game) requests in one pass
+def predict_many(prediction_requests, **kwargs):
+    players_needed = {player_name for player_name, _, _, _ in prediction_requests}
+    opponents_needed = {opponent_team for _, _, opponent_team, _ in prediction_requests}
+    
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+        # Fetch each distinct player and opponent once up front so the predictions below share the cached logs
+        list(executor.map(get_player_home_away_stats, players_needed))
+        list(executor.map(get_opponent_home_away_defense, opponents_needed))
+        
+        futures = [executor.submit(predict_weighted_player_stat, player_name, stat, opponent_team, home_game, **kwargs)
+                   for player_name, stat, opponent_team, home_game in prediction_requests]
+        return [future.result() for future in futures]
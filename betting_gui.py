@@ -1,11 +1,84 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import betting  # Import the betting module
-import time  # For simulating processing time
+import time
+import traceback
+import collections
+import types
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# NBA team abbreviations to full names mapping, shared by every window
+_TEAM_MAPPING = {
+    "ATL": "Atlanta Hawks",
+    "BOS": "Boston Celtics",
+    "BKN": "Brooklyn Nets",
+    "CHA": "Charlotte Hornets",
+    "CHI": "Chicago Bulls",
+    "CLE": "Cleveland Cavaliers",
+    "DAL": "Dallas Mavericks",
+    "DEN": "Denver Nuggets",
+    "DET": "Detroit Pistons",
+    "GSW": "Golden State Warriors",
+    "HOU": "Houston Rockets",
+    "IND": "Indiana Pacers",
+    "LAC": "Los Angeles Clippers",
+    "LAL": "Los Angeles Lakers",
+    "MEM": "Memphis Grizzlies",
+    "MIA": "Miami Heat",
+    "MIL": "Milwaukee Bucks",
+    "MIN": "Minnesota Timberwolves",
+    "NOP": "New Orleans Pelicans",
+    "NYK": "New York Knicks",
+    "OKC": "Oklahoma City Thunder",
+    "ORL": "Orlando Magic",
+    "PHI": "Philadelphia 76ers",
+    "PHX": "Phoenix Suns",
+    "POR": "Portland Trail Blazers",
+    "SAC": "Sacramento Kings",
+    "SAS": "San Antonio Spurs",
+    "TOR": "Toronto Raptors",
+    "UTA": "Utah Jazz",
+    "WAS": "Washington Wizards"
+}
+_TEAM_OPTIONS = tuple(sorted(_TEAM_MAPPING))
+
+# Number of predictions kept in the "Recent Predictions" list
+_HISTORY_LIMIT = 50
+
+# Longer simulations are thinned to at most this many plotted points (stats use every draw)
+_MAX_PLOT_POINTS = 200
+
+# Repeated (player, stat, opponent, home) queries reuse the finished simulation
+# until it is older than the TTL; the betting module's game log caches expire on the
+# same TTL, so a rerun after expiry refits on freshly fetched stats
+_PREDICTION_CACHE_SIZE = 128
+_PREDICTION_TTL = 600  # seconds
+
+def _prediction_key(player_name, stat, team_abbrev, home_game):
+    return (player_name.lower(), stat, team_abbrev, home_game)
+
+# Light theme colors, read as attributes (e.g. _PALETTE.text) throughout the UI
+_PALETTE = types.SimpleNamespace(
+    bg_white="#FFFFFF",
+    bg_light="#F5F7FA",
+    bg_medium="#EAEEF3",
+    accent="#1E88E5",
+    accent_hover="#1976D2",
+    text="#212121",
+    text_secondary="#757575",
+    success="#4CAF50",
+    realistic_high="#15E8E1",
+    realistic_low="#E81915",
+    warning="#FF9800",
+    error="#F44336",
+    button_text="#000000",  # Black text for buttons
+    progress_bar="#1E88E5"  # Color for progress bar
+)
 
 class NBAStatPredictorApp:
     def __init__(self, root):
@@ -15,62 +88,34 @@ class NBAStatPredictorApp:
         self.root.minsize(1000, 700)
         
         # NBA team abbreviations to full names mapping
-        self.team_mapping = {
-            "ATL": "Atlanta Hawks",
-            "BOS": "Boston Celtics",
-            "BKN": "Brooklyn Nets",
-            "CHA": "Charlotte Hornets",
-            "CHI": "Chicago Bulls",
-            "CLE": "Cleveland Cavaliers",
-            "DAL": "Dallas Mavericks",
-            "DEN": "Denver Nuggets",
-            "DET": "Detroit Pistons",
-            "GSW": "Golden State Warriors",
-            "HOU": "Houston Rockets",
-            "IND": "Indiana Pacers",
-            "LAC": "Los Angeles Clippers",
-            "LAL": "Los Angeles Lakers",
-            "MEM": "Memphis Grizzlies",
-            "MIA": "Miami Heat",
-            "MIL": "Milwaukee Bucks",
-            "MIN": "Minnesota Timberwolves",
-            "NOP": "New Orleans Pelicans",
-            "NYK": "New York Knicks",
-            "OKC": "Oklahoma City Thunder",
-            "ORL": "Orlando Magic",
-            "PHI": "Philadelphia 76ers",
-            "PHX": "Phoenix Suns",
-            "POR": "Portland Trail Blazers",
-            "SAC": "Sacramento Kings",
-            "SAS": "San Antonio Spurs",
-            "TOR": "Toronto Raptors",
-            "UTA": "Utah Jazz",
-            "WAS": "Washington Wizards"
-        }
-        
-        # Store historical predictions with all data needed to recreate plots
-        self.prediction_history = []
-        
-        # Set theme colors - Light theme
-        self.colors = {
-            "bg_white": "#FFFFFF",
-            "bg_light": "#F5F7FA",
-            "bg_medium": "#EAEEF3",
-            "accent": "#1E88E5",
-            "accent_hover": "#1976D2",
-            "text": "#212121",
-            "text_secondary": "#757575",
-            "success": "#4CAF50",
-            "realistic_high": "#15E8E1",
-            "realistic_low": "#E81915",
-            "warning": "#FF9800",
-            "error": "#F44336",
-            "button_text": "#000000",  # Black text for buttons
-            "progress_bar": "#1E88E5"  # Color for progress bar
-        }
+        self.team_mapping = _TEAM_MAPPING
+        
+        # Store historical predictions with all data needed to recreate plots (newest first, bounded)
+        self.prediction_history = collections.deque(maxlen=_HISTORY_LIMIT)
+        
+        # Predictions waiting to be added to the history list on the next idle flush
+        self._pending_history = []
+        
+        # Random generator for the demo fallback data
+        self._rng = np.random.default_rng()
+        
+        # Predictions block on HTTP and model fitting, so they run on this worker instead of the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Finished predictions by _prediction_key, least recently used first (only touched on the Tk thread)
+        self._pred_cache = collections.OrderedDict()
+        
+        # Held from the click until the result is displayed, so a prediction cannot be started twice
+        self._prediction_lock = threading.Lock()
+        
+        # The worker posts (value, text) progress here; the Tk thread applies the newest on each poll
+        self._progress_q = queue.Queue()
+        
+        # Light theme colors
+        self.colors = _PALETTE
         
         # Configure root window
-        self.root.configure(bg=self.colors["bg_white"])
+        self.root.configure(bg=self.colors.bg_white)
         
         # Configure ttk styles
         self.setup_styles()
@@ -79,6 +124,9 @@ class NBAStatPredictorApp:
         self.main_container = ttk.Frame(self.root, style="MainFrame.TFrame")
         self.main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
+        # Create menu bar
+        self.create_menu()
+        
         # Create header
         self.create_header()
         
@@ -98,41 +146,44 @@ class NBAStatPredictorApp:
         
         # Create status bar
         self.create_status_bar()
+        
+        # Start polling for progress posted by the worker
+        self.root.after(50, self._drain_progress)
 
     def setup_styles(self):
-        style = ttk.Style()
+        style = ttk.Style(self.root)
         
         # Frame styles
-        style.configure("MainFrame.TFrame", background=self.colors["bg_white"])
-        style.configure("ContentFrame.TFrame", background=self.colors["bg_white"])
-        style.configure("CardFrame.TFrame", background=self.colors["bg_light"])
+        style.configure("MainFrame.TFrame", background=self.colors.bg_white)
+        style.configure("ContentFrame.TFrame", background=self.colors.bg_white)
+        style.configure("CardFrame.TFrame", background=self.colors.bg_light)
         
         # Label styles
         style.configure("TLabel", 
-                       background=self.colors["bg_white"], 
-                       foreground=self.colors["text"],
+                       background=self.colors.bg_white, 
+                       foreground=self.colors.text,
                        font=("Segoe UI", 11))
         style.configure("Header.TLabel", 
-                       background=self.colors["bg_white"], 
-                       foreground=self.colors["text"],
+                       background=self.colors.bg_white, 
+                       foreground=self.colors.text,
                        font=("Segoe UI", 18, "bold"))
         style.configure("Title.TLabel", 
-                       background=self.colors["bg_light"], 
-                       foreground=self.colors["text"],
+                       background=self.colors.bg_light, 
+                       foreground=self.colors.text,
                        font=("Segoe UI", 14, "bold"))
         style.configure("Status.TLabel", 
-                       background=self.colors["bg_medium"], 
-                       foreground=self.colors["text_secondary"],
+                       background=self.colors.bg_medium, 
+                       foreground=self.colors.text_secondary,
                        font=("Segoe UI", 10))
         
         # Button styles
         style.configure("Accent.TButton", 
                        font=("Segoe UI", 11, "bold"))
         style.map("Accent.TButton",
-                  background=[("!active", self.colors["accent"]), 
-                              ("active", self.colors["accent_hover"])],
-                  foreground=[("!active", self.colors["button_text"]), 
-                              ("active", self.colors["button_text"])])
+                  background=[("!active", self.colors.accent), 
+                              ("active", self.colors.accent_hover)],
+                  foreground=[("!active", self.colors.button_text), 
+                              ("active", self.colors.button_text)])
                   
         # Entry style
         style.configure("TEntry", 
@@ -144,16 +195,32 @@ class NBAStatPredictorApp:
                        
         # Radiobutton style
         style.configure("TRadiobutton",
-                       background=self.colors["bg_light"],
-                       foreground=self.colors["text"],
+                       background=self.colors.bg_light,
+                       foreground=self.colors.text,
                        font=("Segoe UI", 11))
         
         # Progress bar style
         style.configure("TProgressbar", 
-                       troughcolor=self.colors["bg_medium"],
-                       background=self.colors["progress_bar"],
+                       troughcolor=self.colors.bg_medium,
+                       background=self.colors.progress_bar,
                        thickness=8)
         
+    def create_menu(self):
+        menubar = tk.Menu(self.root)
+        data_menu = tk.Menu(menubar, tearoff=0)
+        data_menu.add_command(label="Clear Cached Predictions", command=self.clear_prediction_cache)
+        menubar.add_cascade(label="Data", menu=data_menu)
+        self.root.configure(menu=menubar)
+        
+    def clear_prediction_cache(self):
+        """Forget cached predictions and game logs so the next run uses refreshed stats"""
+        self._pred_cache.clear()
+        betting.clear_caches()
+        self.status_label.configure(
+            text="Cleared cached predictions.", 
+            foreground=self.colors.text_secondary
+        )
+        
     def create_header(self):
         header_frame = ttk.Frame(self.main_container, style="MainFrame.TFrame")
         header_frame.pack(fill=tk.X, pady=(0, 15))
@@ -176,27 +243,28 @@ class NBAStatPredictorApp:
         input_title.pack(anchor=tk.W, pady=(0, 15))
         
         # Player name input
-        ttk.Label(self.input_inner_frame, text="Player Name:", background=self.colors["bg_light"]).pack(anchor=tk.W, pady=(10, 5))
+        ttk.Label(self.input_inner_frame, text="Player Name:", background=self.colors.bg_light).pack(anchor=tk.W, pady=(10, 5))
         self.player_entry = ttk.Entry(self.input_inner_frame, width=30)
         self.player_entry.pack(fill=tk.X, pady=(0, 10))
         
         # Stat selection (using combobox instead of text entry)
-        ttk.Label(self.input_inner_frame, text="Stat Type:", background=self.colors["bg_light"]).pack(anchor=tk.W, pady=(10, 5))
+        ttk.Label(self.input_inner_frame, text="Stat Type:", background=self.colors.bg_light).pack(anchor=tk.W, pady=(10, 5))
         self.stat_var = tk.StringVar()
         stat_options = ["PTS", "REB", "AST", "STL", "BLK"]
         self.stat_combo = ttk.Combobox(self.input_inner_frame, textvariable=self.stat_var, values=stat_options, state="readonly")
         self.stat_combo.pack(fill=tk.X, pady=(0, 10))
         
         # Team name dropdown (changed from entry to combobox)
-        ttk.Label(self.input_inner_frame, text="Opponent Team:", background=self.colors["bg_light"]).pack(anchor=tk.W, pady=(10, 5))
+        ttk.Label(self.input_inner_frame, text="Opponent Team:", background=self.colors.bg_light).pack(anchor=tk.W, pady=(10, 5))
         self.team_var = tk.StringVar()
-        # NBA team abbreviations
-        team_options = sorted(list(self.team_mapping.keys()))
-        self.team_combo = ttk.Combobox(self.input_inner_frame, textvariable=self.team_var, values=team_options, state="readonly")
+        self.team_combo = ttk.Combobox(self.input_inner_frame, textvariable=self.team_var, values=_TEAM_OPTIONS, state="readonly")
         self.team_combo.pack(fill=tk.X, pady=(0, 10))
+        # Resolve the full team name once per selection rather than on every prediction
+        self.selected_team_full = None
+        self.team_combo.bind("<<ComboboxSelected>>", self.on_team_selected)
         
         # Game location
-        ttk.Label(self.input_inner_frame, text="Game Location:", background=self.colors["bg_light"]).pack(anchor=tk.W, pady=(10, 5))
+        ttk.Label(self.input_inner_frame, text="Game Location:", background=self.colors.bg_light).pack(anchor=tk.W, pady=(10, 5))
         self.home_var = tk.StringVar(value="Home")
         location_frame = ttk.Frame(self.input_inner_frame, style="CardFrame.TFrame")
         location_frame.pack(fill=tk.X, pady=(0, 15))
@@ -218,6 +286,10 @@ class NBAStatPredictorApp:
         )
         self.predict_button.pack(fill=tk.X)
         
+        # Enter in the player or stat field runs the prediction without moving focus to the button
+        self.player_entry.bind("<Return>", lambda event: self.start_prediction())
+        self.stat_combo.bind("<Return>", lambda event: self.start_prediction())
+        
         # Progress bar (hidden by default)
         progress_frame = ttk.Frame(self.input_inner_frame, style="CardFrame.TFrame")
         progress_frame.pack(fill=tk.X, pady=(0, 15))
@@ -235,14 +307,16 @@ class NBAStatPredictorApp:
         self.progress_label = ttk.Label(
             progress_frame,
             text="", 
-            background=self.colors["bg_light"],
-            foreground=self.colors["text_secondary"],
+            background=self.colors.bg_light,
+            foreground=self.colors.text_secondary,
             font=("Segoe UI", 9)
         )
         self.progress_label.pack(anchor=tk.E, padx=5)
         
         # Initially hide the progress
         self.progress["value"] = 0
+        self._last_progress_value = 0
+        self._last_progress_text = ""
         
         # Prediction history - Make it bigger and show more details
         history_label = ttk.Label(self.input_inner_frame, text="Recent Predictions:", style="Title.TLabel")
@@ -252,8 +326,8 @@ class NBAStatPredictorApp:
         click_info = ttk.Label(
             self.input_inner_frame,
             text="Click on a prediction to view its graph",
-            background=self.colors["bg_light"],
-            foreground=self.colors["accent"],
+            background=self.colors.bg_light,
+            foreground=self.colors.accent,
             font=("Segoe UI", 9, "italic")
         )
         click_info.pack(anchor=tk.W, pady=(0, 5))
@@ -264,10 +338,10 @@ class NBAStatPredictorApp:
         
         self.result_list = tk.Listbox(
             history_frame, 
-            background=self.colors["bg_white"],
-            foreground=self.colors["text"],
-            selectbackground=self.colors["accent"],
-            selectforeground=self.colors["bg_white"],
+            background=self.colors.bg_white,
+            foreground=self.colors.text,
+            selectbackground=self.colors.accent,
+            selectforeground=self.colors.bg_white,
             font=("Segoe UI", 10),
             borderwidth=1,
             highlightthickness=0,
@@ -296,24 +370,58 @@ class NBAStatPredictorApp:
         
         # Create matplotlib figure with light theme
         self.fig = Figure(figsize=(5, 4), dpi=100)
-        self.fig.patch.set_facecolor(self.colors["bg_light"])
+        self.fig.patch.set_facecolor(self.colors.bg_light)
         
         self.ax = self.fig.add_subplot(111)
-        self.ax.set_facecolor(self.colors["bg_white"])
+        self.ax.set_facecolor(self.colors.bg_white)
+        # Fixed margins instead of re-running tight_layout for every prediction
+        self.fig.subplots_adjust(left=0.12, right=0.97, top=0.9, bottom=0.12)
         
         # Default plot text and grid settings
-        self.ax.set_title("Run a prediction to see results", color=self.colors["text"])
-        self.ax.set_xlabel("Simulation Number", color=self.colors["text_secondary"])
-        self.ax.set_ylabel("Stat Value", color=self.colors["text_secondary"])
-        self.ax.tick_params(colors=self.colors["text_secondary"])
-        self.ax.grid(True, linestyle='--', alpha=0.3, color=self.colors["bg_medium"])
+        self.title_artist = self.ax.set_title("Run a prediction to see results", color=self.colors.text)
+        self.ax.set_xlabel("Simulation Number", color=self.colors.text_secondary)
+        self.ax.set_ylabel("Stat Value", color=self.colors.text_secondary)
+        self.ax.tick_params(colors=self.colors.text_secondary)
+        self.ax.grid(True, linestyle='--', alpha=0.3, color=self.colors.bg_medium)
         
         for spine in self.ax.spines.values():
-            spine.set_color(self.colors["bg_medium"])
+            spine.set_color(self.colors.bg_medium)
+        
+        # Data artists are created once and updated in place. They are animated, so full
+        # draws only render the static background and the artists are blitted on top of it
+        self.sim_line, = self.ax.plot([], [], marker='o', linestyle='-', color=self.colors.accent, alpha=0.8, markersize=4)
+        # Horizontal line and annotation pairs for the mean, realistic high and realistic low
+        self.reference_lines = []
+        self.reference_annotations = []
+        for color in (self.colors.success, self.colors.realistic_high, self.colors.realistic_low):
+            self.reference_lines.append(self.ax.axhline(y=0, color=color, linestyle='--', alpha=0.8))
+            # Anchored to the right edge of the axes so the label never runs off the figure
+            self.reference_annotations.append(self.ax.annotate(
+                '', xy=(0.98, 0), xycoords=('axes fraction', 'data'), xytext=(0, 5), textcoords='offset points',
+                color=color, fontsize=9, fontweight='bold', ha='right'
+            ))
+        self.range_annotation = self.ax.annotate(
+            '', xy=(0.98, 0.02), xycoords='axes fraction',
+            color=self.colors.text_secondary, fontsize=8, ha='right'
+        )
+        self.animated_artists = (self.sim_line, *self.reference_lines, *self.reference_annotations, self.range_annotation)
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+            artist.set_visible(False)
+        
+        # Simulation-number x values, keyed by prediction count (usually the same every run)
+        self._x_cache = {}
+        
+        # Title, labels and limits currently baked into the cached background
+        self.plot_layout = None
+        self.plot_background = None
         
         # Add canvas to frame
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_inner_frame)
-        self.canvas.draw()
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+        # Render the static background once the window is mapped at its real size (this
+        # coalesces with the resize redraw); on_canvas_draw caches it for the first blit
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Add tips text
@@ -333,10 +441,17 @@ class NBAStatPredictorApp:
         )
         self.status_label.pack(fill=tk.X)
 
+    def on_team_selected(self, event):
+        """Cache the full name of the selected opponent (the readonly combobox only offers known abbreviations)"""
+        self.selected_team_full = self.team_mapping[self.team_var.get()]
+        
     def start_prediction(self):
         """Start the prediction process with a loading bar"""
+        if not self._prediction_lock.acquire(blocking=False):
+            return
+        
         player_name = self.player_entry.get().strip()
-        stat = self.stat_var.get() if self.stat_var.get() else self.stat_combo.get()
+        stat = self.stat_var.get()  # The combobox's textvariable, so no need to read the widget too
         team_abbrev = self.team_var.get()  # Get from combobox variable
         home_game = self.home_var.get() == "Home"
         
@@ -344,77 +459,133 @@ class NBAStatPredictorApp:
         if not player_name or not stat or not team_abbrev:
             self.status_label.configure(
                 text="Error: Please fill in all required fields.", 
-                foreground=self.colors["error"]
+                foreground=self.colors.error
             )
+            self._prediction_lock.release()
             return
         
         # Reset progress bar
-        self.progress["value"] = 0
-        self.progress_label.configure(text="0%")
+        self.update_progress(0)
         
         # Show loading state
         self.status_label.configure(
             text="Preparing simulation...", 
-            foreground=self.colors["text_secondary"]
+            foreground=self.colors.text_secondary
         )
         
         # Disable button during processing
         self.predict_button.configure(state="disabled")
         
-        # Start the prediction process in a separate method
-        # This allows us to update the progress bar
-        self.root.after(50, lambda: self.run_prediction(player_name, stat, team_abbrev, home_game))
+        # Hand the work to the worker thread straight away; progress arrives through the queue
+        self.run_prediction(player_name, stat, team_abbrev, home_game)
         
     def update_progress(self, value, text=None):
-        """Update the progress bar and label"""
-        self.progress["value"] = value
-        if text:
+        """Update the progress bar and label, skipping widgets whose shown value would not change"""
+        if value != self._last_progress_value:
+            self.progress["value"] = value
+            self._last_progress_value = value
+        if not text:
+            text = f"{int(value)}%"
+        if text != self._last_progress_text:
             self.progress_label.configure(text=text)
-        else:
-            self.progress_label.configure(text=f"{int(value)}%")
-        self.root.update_idletasks()
+            self._last_progress_text = text
+        
+    def _take_latest_progress(self):
+        """Empty the progress queue and return the newest (value, text), or None"""
+        latest = None
+        while True:
+            try:
+                latest = self._progress_q.get_nowait()
+            except queue.Empty:
+                return latest
+        
+    def _drain_progress(self):
+        """Apply only the newest progress posted by the worker, then poll again"""
+        latest = self._take_latest_progress()
+        if latest is not None:
+            self.update_progress(*latest)
+        self.root.after(50, self._drain_progress)
+        
+    def compute_prediction(self, player_name, stat, team_full_name, home_game):
+        """Load the data and run the prediction (worker thread: no Tk calls, progress goes through the queue)"""
+        # Fetching the home/away splits first warms the betting caches the prediction reads from
+        self._progress_q.put((10, "Loading player data..."))
+        betting.get_player_home_away_stats(player_name)
+        
+        self._progress_q.put((30, "Analyzing team matchups..."))
+        betting.get_opponent_home_away_defense(team_full_name)
+        
+        self._progress_q.put((50, "Running simulation..."))
+        prediction_mean, predictions = betting.predict_weighted_player_stat(player_name, stat, team_full_name, home_game)
+        predictions.setflags(write=False)  # Shared between cache hits, so keep it immutable
+        return prediction_mean, predictions
+        
+    def get_cached_prediction(self, key):
+        """Return the cached (mean, predictions) for key, or None if missing or expired"""
+        entry = self._pred_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > _PREDICTION_TTL:
+            del self._pred_cache[key]
+            return None
+        self._pred_cache.move_to_end(key)
+        return result
+        
+    def store_prediction(self, key, result):
+        """Cache a finished prediction, evicting the least recently used beyond the limit"""
+        self._pred_cache[key] = (time.monotonic(), result)
+        if len(self._pred_cache) > _PREDICTION_CACHE_SIZE:
+            self._pred_cache.popitem(last=False)
         
     def run_prediction(self, player_name, stat, team_abbrev, home_game):
-        """Run the prediction with progress updates"""
+        """Run the prediction on the worker thread while the Tk thread keeps polling its progress"""
+        # Full team name resolved when the abbreviation was selected
+        team_full_name = self.selected_team_full
+        
+        # A fresh cached result skips the worker and is displayed right away
+        cached = self.get_cached_prediction(_prediction_key(player_name, stat, team_abbrev, home_game))
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            self.finish_prediction(future, player_name, stat, team_abbrev, home_game)
+            return
+        
+        # Refetch game logs that have outlived the TTL (safe here: the worker is idle)
+        betting.expire_caches(_PREDICTION_TTL)
+        
+        # Call the prediction function with the full team name; the result is
+        # handed back to the Tk thread through root.after
+        future = self._executor.submit(self.compute_prediction, player_name, stat, team_full_name, home_game)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self.finish_prediction, f, player_name, stat, team_abbrev, home_game)
+        )
+        
+    def finish_prediction(self, future, player_name, stat, team_abbrev, home_game):
+        """Display a finished prediction (runs on the Tk thread)"""
+        # Drop progress the poller has not applied yet so it cannot overwrite the final state
+        self._take_latest_progress()
+        
         try:
-            # Convert team abbreviation to full name
-            team_full_name = self.team_mapping.get(team_abbrev, team_abbrev)
-            
-            # Simulate loading steps with progress updates
-            self.update_progress(10, "Loading player data...")
-            self.root.after(200)  # Simulate processing time
-            
-            self.update_progress(30, "Analyzing team matchups...")
-            self.root.after(200)
+            prediction_mean, predictions = future.result()
             
-            self.update_progress(50, "Running simulation...")
-            self.root.after(200)
-            
-            self.update_progress(70, "Calculating probabilities...")
-            self.root.after(200)
-            
-            self.update_progress(90, "Finalizing prediction...")
-            self.root.after(200)
-            
-            # Call the prediction function with the full team name
-            prediction_mean, predictions = betting.predict_weighted_player_stat(player_name, stat, team_full_name, home_game)
+            key = _prediction_key(player_name, stat, team_abbrev, home_game)
+            if key not in self._pred_cache:
+                self.store_prediction(key, (prediction_mean, predictions))
             
             # Complete the progress
             self.update_progress(100, "Complete!")
             
             # Calculate additional stats
-            realistic_high_val = np.percentile(predictions, 90)
-            realistic_low_val = np.percentile(predictions, 5)
+            realistic_low_val, realistic_high_val = np.percentile(predictions, [5, 90])
             
             # Format the result with realistic high and low values
             location_text = "Home" if home_game else "Away"
             result_text = f"{player_name} vs {team_abbrev} ({location_text}): {prediction_mean:.1f} {stat} [H: {realistic_high_val:.1f}, L: {realistic_low_val:.1f}]"
             
             # Add to history list with timestamp
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            timestamp = time.strftime("%H:%M:%S")
             list_text = f"[{timestamp}] {result_text}"
-            self.result_list.insert(0, list_text)
             
             # Store prediction data for history
             prediction_data = {
@@ -423,7 +594,7 @@ class NBAStatPredictorApp:
                 'team_abbrev': team_abbrev,
                 'home_game': home_game,
                 'prediction_mean': prediction_mean,
-                'predictions': predictions.copy(),  # Make a copy to ensure it's not modified
+                'predictions': predictions,  # Read-only, so history can share it with the cache
                 'realistic_high': realistic_high_val,
                 'realistic_low': realistic_low_val,
                 'timestamp': timestamp,
@@ -431,7 +602,7 @@ class NBAStatPredictorApp:
             }
             
             # Add to history (at the beginning)
-            self.prediction_history.insert(0, prediction_data)
+            self.add_to_history(prediction_data)
             
             # Plot the results
             self.plot_simulation_results(predictions, player_name, stat, team_abbrev, home_game, 
@@ -440,27 +611,26 @@ class NBAStatPredictorApp:
             # Update status
             self.status_label.configure(
                 text=f"Prediction complete: {result_text}", 
-                foreground=self.colors["success"]
+                foreground=self.colors.success
             )
             
         except Exception as e:
             # Handle errors
             self.status_label.configure(
                 text=f"Error: {str(e)}", 
-                foreground=self.colors["error"]
+                foreground=self.colors.error
             )
             
             # For debugging purposes, we'll also print the full exception details
-            import traceback
             print("Exception in prediction function:")
             print(traceback.format_exc())
             
             # Create fallback simulation data if there's an error with the prediction module
             try:
-                prediction_mean = 20.5 + np.random.normal(0, 3)
-                predictions = np.array([prediction_mean + np.random.normal(0, 2) for _ in range(20)])
-                realistic_high_val = np.percentile(predictions, 90)
-                realistic_low_val = np.percentile(predictions, 5)
+                prediction_mean = 20.5 + 3 * self._rng.standard_normal()
+                predictions = self._rng.normal(prediction_mean, 2, size=20)
+                predictions.setflags(write=False)
+                realistic_low_val, realistic_high_val = np.percentile(predictions, [5, 90])
                 
                 # Log that we're using fallback data
                 print("Using fallback simulation data.")
@@ -473,10 +643,8 @@ class NBAStatPredictorApp:
                 result_text = f"{player_name} vs {team_abbrev} ({location_text}): {prediction_mean:.1f} {stat} [H: {realistic_high_val:.1f}, L: {realistic_low_val:.1f}] (DEMO)"
                 
                 # Add to history list with timestamp
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+                timestamp = time.strftime("%H:%M:%S")
                 list_text = f"[{timestamp}] {result_text}"
-                self.result_list.insert(0, list_text)
                 
                 # Store prediction data for history
                 prediction_data = {
@@ -485,7 +653,7 @@ class NBAStatPredictorApp:
                     'team_abbrev': team_abbrev,
                     'home_game': home_game,
                     'prediction_mean': prediction_mean,
-                    'predictions': predictions.copy(),
+                    'predictions': predictions,
                     'realistic_high': realistic_high_val,
                     'realistic_low': realistic_low_val,
                     'timestamp': timestamp,
@@ -494,7 +662,7 @@ class NBAStatPredictorApp:
                 }
                 
                 # Add to history (at the beginning)
-                self.prediction_history.insert(0, prediction_data)
+                self.add_to_history(prediction_data)
                 
                 # Plot the results
                 self.plot_simulation_results(predictions, player_name, stat, team_abbrev, home_game, 
@@ -503,7 +671,7 @@ class NBAStatPredictorApp:
                 # Update status
                 self.status_label.configure(
                     text=f"Demo prediction complete: {result_text}", 
-                    foreground=self.colors["warning"]
+                    foreground=self.colors.warning
                 )
             except:
                 # If even the fallback fails, just log it
@@ -512,96 +680,90 @@ class NBAStatPredictorApp:
         finally:
             # Re-enable button
             self.predict_button.configure(state="normal")
+            self._prediction_lock.release()
             
+    def add_to_history(self, prediction_data):
+        """Queue a prediction for the history list; queued entries are added together once Tk is idle"""
+        self._pending_history.append(prediction_data)
+        if len(self._pending_history) == 1:
+            self.root.after_idle(self.flush_history)
+        
+    def flush_history(self):
+        """Prepend the queued predictions to the history list, dropping the oldest beyond the limit"""
+        for prediction_data in self._pending_history:
+            self.prediction_history.appendleft(prediction_data)
+            self.result_list.insert(0, prediction_data['list_text'])
+        self._pending_history.clear()
+        if self.result_list.size() > _HISTORY_LIMIT:
+            self.result_list.delete(_HISTORY_LIMIT, tk.END)
+        
+    def on_canvas_draw(self, event):
+        """Cache the freshly drawn background (also after resizes) and paint the data artists over it"""
+        self.plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.animated_artists:
+            self.ax.draw_artist(artist)
+        
     def plot_simulation_results(self, predictions, player_name, stat, team_abbrev, home_game, 
                               mean_val=None, realistic_high_val=None, realistic_low_val=None, is_demo=False):
-        # Clear previous plot
-        self.ax.clear()
-        
-        # Plot data
-        x = range(1, len(predictions) + 1)
-        self.ax.plot(x, predictions, marker='o', linestyle='-', color=self.colors["accent"], alpha=0.8, markersize=4)
+        # Convert once so every statistic below works on the same array
+        predictions = np.asarray(predictions, dtype=np.float64)
         
         # Calculate stats if not provided
         if mean_val is None:
-            mean_val = np.mean(predictions)
-        if realistic_high_val is None:
-            realistic_high_val = np.percentile(predictions, 90)
-        if realistic_low_val is None:
-            realistic_low_val = np.percentile(predictions, 5)
+            mean_val = predictions.mean()
+        if realistic_high_val is None or realistic_low_val is None:
+            low, high = np.percentile(predictions, [5, 90])
+            realistic_high_val = high if realistic_high_val is None else realistic_high_val
+            realistic_low_val = low if realistic_low_val is None else realistic_low_val
             
-        max_val = np.max(predictions)
-        min_val = np.min(predictions)
+        max_val = predictions.max()
+        min_val = predictions.min()
+        
+        # Update the data line and the horizontal lines for the mean, realistic high and low values
+        stride = -(-predictions.size // _MAX_PLOT_POINTS)
+        x = self._x_cache.get(predictions.size)
+        if x is None:
+            x = self._x_cache[predictions.size] = np.arange(1, predictions.size + 1)[::stride]
+        self.sim_line.set_data(x, predictions[::stride])
+        references = (('Mean', mean_val), ('Realistic High', realistic_high_val), ('Realistic Low', realistic_low_val))
+        for line, annotation, (label, y) in zip(self.reference_lines, self.reference_annotations, references):
+            line.set_ydata([y, y])
+            annotation.set_text(f'{label}: {y:.1f}')
+            annotation.xy = (0.98, y)
         
-        # Add a horizontal lines for the mean, realistic high and low values
-        self.ax.axhline(y=mean_val, color=self.colors["success"], linestyle='--', alpha=0.8)
-        self.ax.axhline(y=realistic_high_val, color=self.colors["realistic_high"], linestyle='--', alpha=0.8)
-        self.ax.axhline(y=realistic_low_val, color=self.colors["realistic_low"], linestyle='--', alpha=0.8)
-
-        # Add annotation for mean
-        self.ax.annotate(
-            f'Mean: {mean_val:.1f}', 
-            xy=(len(predictions)*0.8, mean_val),
-            xytext=(5, 5),
-            textcoords='offset points',
-            color=self.colors["success"],
-            fontsize=9,
-            fontweight='bold'
-        )
-
-        # Add annotation for realistic high
-        self.ax.annotate(
-            f'Realistic High: {realistic_high_val:.1f}', 
-            xy=(len(predictions)*0.8, realistic_high_val),
-            xytext=(5, 5),
-            textcoords='offset points',
-            color=self.colors["realistic_high"],
-            fontsize=9,
-            fontweight='bold'
-        )
-
-        # Add annotation for realistic low
-        self.ax.annotate(
-            f'Realistic Low: {realistic_low_val:.1f}', 
-            xy=(len(predictions)*0.8, realistic_low_val),
-            xytext=(5, 5),
-            textcoords='offset points',
-            color=self.colors["realistic_low"],
-            fontsize=9,
-            fontweight='bold'
-        )
+        # Add range info
+        self.range_annotation.set_text(f'Range: {min_val:.1f} - {max_val:.1f}')
+        
+        for artist in self.animated_artists:
+            artist.set_visible(True)
         
         # Plot customization
         location_text = "Home" if home_game else "Away"
         title_text = f"{player_name}: {stat} vs {team_abbrev} ({location_text})"
         if is_demo:
             title_text += " (DEMO)"
-            
-        self.ax.set_title(title_text, color=self.colors["text"], fontsize=12, fontweight='bold')
-        self.ax.set_xlabel("Simulation Number", color=self.colors["text_secondary"])
-        self.ax.set_ylabel(stat, color=self.colors["text_secondary"])
         
-        # Add range info
-        self.ax.annotate(
-            f'Range: {min_val:.1f} - {max_val:.1f}',
-            xy=(0.98, 0.02),
-            xycoords='axes fraction',
-            color=self.colors["text_secondary"],
-            fontsize=8,
-            ha='right'
-        )
-        
-        # Style the plot
-        self.ax.tick_params(colors=self.colors["text_secondary"])
-        self.ax.set_facecolor(self.colors["bg_white"])
-        self.ax.grid(True, linestyle='--', alpha=0.3, color=self.colors["bg_medium"])
-        
-        for spine in self.ax.spines.values():
-            spine.set_color(self.colors["bg_medium"])
-        
-        # Draw the updated plot
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # Explicit limits with a small margin, rather than autoscaling over every artist
+        x_pad = 0.05 * max(len(predictions) - 1, 1)
+        y_pad = 0.05 * ((max_val - min_val) or 1)
+        xlim = (1 - x_pad, len(predictions) + x_pad)
+        ylim = (min_val - y_pad, max_val + y_pad)
+        layout = (title_text, stat, xlim, ylim)
+        
+        if layout != self.plot_layout or self.plot_background is None:
+            # Title, labels or limits changed: redraw the static background once
+            self.title_artist.set(text=title_text, fontsize=12, fontweight='bold')
+            self.ax.set_ylabel(stat, color=self.colors.text_secondary)
+            self.ax.set_xlim(*xlim)
+            self.ax.set_ylim(*ylim)
+            self.plot_layout = layout
+            self.canvas.draw_idle()
+        else:
+            # Only the data artists changed: blit them over the cached background
+            self.canvas.restore_region(self.plot_background)
+            for artist in self.animated_artists:
+                self.ax.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
         
     def show_historical_plot(self, event):
         """Show historical plot when a prediction is clicked in the history"""
@@ -615,7 +777,7 @@ class NBAStatPredictorApp:
             # Update status
             self.status_label.configure(
                 text=f"Showing historical prediction: {prediction_data['list_text']}", 
-                foreground=self.colors["accent"]
+                foreground=self.colors.accent
             )
             
             # Recreate the plot using the stored data
@@ -635,7 +797,7 @@ class NBAStatPredictorApp:
             # This might happen if the list is empty or the data is missing
             self.status_label.configure(
                 text="Error: Could not load the selected prediction.", 
-                foreground=self.colors["error"]
+                foreground=self.colors.error
             )
             print(f"Error loading historical prediction: {str(e)}")
 
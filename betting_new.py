@@ -7,6 +7,10 @@ from tkinter import ttk, messagebox, scrolledtext
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+import functools
+import itertools
+import math
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,6 +22,119 @@ from nba_api.stats.static import players, teams
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
 import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+# Most stats.nba.com requests in flight at once, across every thread and pool (same cap as
+# betting.py's _FETCH_WORKERS); kept small to stay within the API's rate limits
+_FETCH_WORKERS = 8
+_FETCH_SLOTS = threading.BoundedSemaphore(_FETCH_WORKERS)
+
+
+# Stat type to the NBA API column(s) summed for it
+_STAT_MAPPING = types.MappingProxyType({
+    'points': ('PTS',),
+    'rebounds': ('REB',),
+    'assists': ('AST',),
+    'threes': ('FG3M',),
+    'pts+rebs': ('PTS', 'REB'),
+    'pts+asts': ('PTS', 'AST'),
+    'rebs+asts': ('REB', 'AST')
+})
+
+# Recent-trend weights for the last five games, most recent first
+_TREND_WEIGHTS = np.array([0.35, 0.25, 0.20, 0.15, 0.05])
+_TREND_WEIGHTS.setflags(write=False)
+
+# Game log columns the analyzer reads; the rest of PlayerGameLog's ~30 columns are dropped before caching
+_GAMELOG_COLUMNS = ['GAME_DATE', 'MATCHUP', 'MIN', 'PTS', 'REB', 'AST', 'FG3M']
+_GAMELOG_NUMERIC = ['MIN', 'PTS', 'REB', 'AST', 'FG3M']
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_full_gamelog(player_id, season):
+    """Fetch a player's full regular-season game log (cached; copy before mutating)"""
+    with _FETCH_SLOTS:
+        gamelog = PlayerGameLog(player_id=player_id, season=season, season_type_all_star='Regular Season')
+        df = gamelog.get_data_frames()[0]
+    df = df[[col for col in _GAMELOG_COLUMNS if col in df.columns]].copy()
+    for col in _GAMELOG_NUMERIC:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
+
+@functools.lru_cache(maxsize=4)
+def _fetch_league_dash(season):
+    """Fetch advanced per-game stats for every team in one call (cached per season)"""
+    with _FETCH_SLOTS:
+        team_stats = LeagueDashTeamStats(
+            season=season,
+            season_type_all_star='Regular Season',
+            # "Advanced" contains both DEF_RATING and PACE; "Defense" often does NOT include PACE.
+            measure_type_detailed_defense='Advanced',
+            per_mode_detailed='PerGame',
+            # PaceAdjust is a Y/N flag in nba_api parameter mapping.
+            pace_adjust='N'
+        )
+        return team_stats.get_data_frames()[0]
+
+
+@functools.lru_cache(maxsize=4)
+def _league_dash_index(season):
+    """Index the league table's rows by TEAM_ID and by upper-case TEAM_ABBREVIATION"""
+    rows = _fetch_league_dash(season).to_dict('records')
+    by_id = {row['TEAM_ID']: row for row in rows if 'TEAM_ID' in row}
+    by_abbr = {str(row['TEAM_ABBREVIATION']).upper(): row for row in rows if 'TEAM_ABBREVIATION' in row}
+    return by_id, by_abbr
+
+
+# Seconds cached game logs and league tables stay fresh in a long-running session
+_CACHE_TTL = 3600
+_caches_cleared_at = time.monotonic()
+
+
+def clear_caches():
+    """Drop the cached game logs and league tables so the next analysis fetches fresh stats"""
+    global _caches_cleared_at
+    for cached in (_fetch_full_gamelog, _fetch_league_dash, _league_dash_index):
+        cached.cache_clear()
+    _caches_cleared_at = time.monotonic()
+
+
+def expire_caches(max_age=_CACHE_TTL):
+    """Clear the caches once they may hold stats older than max_age seconds"""
+    if time.monotonic() - _caches_cleared_at > max_age:
+        clear_caches()
+
+
+def _index_teams():
+    """Build lower-case abbreviation, full name and nickname indices plus a substring search list"""
+    by_abbr, by_full, by_nick, search = {}, {}, {}, []
+    for t in teams.get_teams():
+        resolved = {'team_id': t['id'], 'abbr': t['abbreviation'].upper(), 'full_name': t.get('full_name', '')}
+        full = (t.get('full_name') or '').lower()
+        nick = (t.get('nickname') or '').lower()
+        city = (t.get('city') or '').lower()
+        by_abbr.setdefault(resolved['abbr'].lower(), resolved)
+        by_full.setdefault(full, resolved)
+        by_nick.setdefault(nick, resolved)
+        search.append((resolved, full, nick, city))
+    return by_abbr, by_full, by_nick, search
+
+
+# The team and player lists are static, so they are indexed once at import
+_TEAMS_BY_ABBR, _TEAMS_BY_FULL, _TEAMS_BY_NICK, _TEAMS_SEARCH = _index_teams()
+_ACTIVE_PLAYER_NAMES = sorted(player['full_name'] for player in players.get_active_players())
+
+
+def american_to_decimal(odds):
+    """Convert American odds (e.g. -110, +150) to decimal odds; accepts a scalar or an array"""
+    odds = np.asarray(odds, dtype=np.float64)
+    if np.any(odds == 0):
+        raise ValueError("American odds cannot be 0")
+    decimal_odds = np.where(odds > 0, odds / 100 + 1, 100 / np.abs(odds) + 1)
+    return decimal_odds if decimal_odds.ndim else float(decimal_odds)
 
 
 class NBAPlayerPropAnalyzer:
@@ -25,6 +142,8 @@ class NBAPlayerPropAnalyzer:
         self.current_season = "2025-26"
         self.scaler = StandardScaler()
         self.model = None
+        self.rng = np.random.default_rng()
+        self._io_pool = ThreadPoolExecutor(max_workers=_FETCH_WORKERS)
         
     def get_player_recent_games(self, player_name, num_games=None):
         """Fetch recent game logs for a player"""
@@ -34,13 +153,13 @@ class NBAPlayerPropAnalyzer:
                 return None
             
             player_id = player_dict[0]['id']
-            gamelog = PlayerGameLog(player_id=player_id, season=self.current_season, season_type_all_star='Regular Season')
-            df = gamelog.get_data_frames()[0]
+            df = _fetch_full_gamelog(player_id, self.current_season)
             
-            # Return all games if num_games is None, otherwise return specified number
+            # Return all games if num_games is None, otherwise return specified number.
+            # Copies keep callers from mutating the cached frame.
             if num_games is None:
-                return df
-            return df.head(num_games)
+                return df.copy()
+            return df.head(num_games).copy()
         except Exception as e:
             print(f"Error fetching player data: {e}")
             return None
@@ -54,59 +173,31 @@ class NBAPlayerPropAnalyzer:
         if not raw:
             return None
 
-        all_teams = teams.get_teams()
-
-        # 1) Exact abbreviation match (fast path)
-        if len(raw) == 3:
-            abbr = raw.upper()
-            for t in all_teams:
-                if t.get('abbreviation', '').upper() == abbr:
-                    return {'team_id': t['id'], 'abbr': t['abbreviation'].upper(), 'full_name': t.get('full_name', '')}
-
-        # 2) nba_api helpers (they expect "full name" style input)
-        # These can return multiple matches; prefer an exact case-insensitive full_name match.
-        candidates = []
-        try:
-            candidates.extend(teams.find_teams_by_full_name(raw))
-        except Exception:
-            pass
-        try:
-            candidates.extend(teams.find_teams_by_nickname(raw))
-        except Exception:
-            pass
-
         raw_lower = raw.lower()
 
-        def score_team(t):
-            full = (t.get('full_name') or '').lower()
-            nick = (t.get('nickname') or '').lower()
-            city = (t.get('city') or '').lower()
-            abbr = (t.get('abbreviation') or '').lower()
-
-            # Higher is better
-            if full == raw_lower:
-                return 100
-            if abbr == raw_lower:
-                return 95
-            if nick == raw_lower:
-                return 90
-            if raw_lower in full:
-                return 80
-            if raw_lower in nick:
-                return 70
-            if raw_lower in city:
-                return 60
-            return 0
-
-        # 3) Fallback: scan all teams
-        if not candidates:
-            candidates = all_teams
+        # 1) Exact full name, abbreviation or nickname match
+        for index in (_TEAMS_BY_FULL, _TEAMS_BY_ABBR, _TEAMS_BY_NICK):
+            resolved = index.get(raw_lower)
+            if resolved:
+                return dict(resolved)
 
-        best = max(candidates, key=score_team, default=None)
-        if best and score_team(best) > 0:
-            return {'team_id': best['id'], 'abbr': best['abbreviation'].upper(), 'full_name': best.get('full_name', '')}
+        # 2) Substring match, preferring the full name, then the nickname, then the city
+        best, best_rank = None, 3
+        for resolved, full, nick, city in _TEAMS_SEARCH:
+            if raw_lower in full:
+                rank = 0
+            elif raw_lower in nick:
+                rank = 1
+            elif raw_lower in city:
+                rank = 2
+            else:
+                continue
+            if rank < best_rank:
+                best, best_rank = resolved, rank
+                if rank == 0:
+                    break
 
-        return None
+        return dict(best) if best else None
 
     def get_team_defense_stats(self, team_input):
         """Get defensive statistics for opponent team.
@@ -119,33 +210,19 @@ class NBAPlayerPropAnalyzer:
             return None
 
         try:
-            # Ask specifically for defensive measures (important; otherwise DEF_RATING may not exist)
-            team_stats = LeagueDashTeamStats(
-                season=self.current_season,
-                season_type_all_star='Regular Season',
-                # "Advanced" contains both DEF_RATING and PACE; "Defense" often does NOT include PACE.
-                measure_type_detailed_defense='Advanced',
-                per_mode_detailed='PerGame',
-                # PaceAdjust is a Y/N flag in nba_api parameter mapping.
-                pace_adjust='N'
-            )
-            df = team_stats.get_data_frames()[0]
+            # Ask specifically for defensive measures (important; otherwise DEF_RATING may not exist).
+            # The table covers every team, so it is fetched and indexed once per season.
+            by_id, by_abbr = _league_dash_index(self.current_season)
 
-            # Match by TEAM_ID first (most reliable)
-            team_data = df[df.get('TEAM_ID') == resolved['team_id']] if 'TEAM_ID' in df.columns else pd.DataFrame()
-            if team_data.empty:
-                # Fallback to abbreviation match
-                if 'TEAM_ABBREVIATION' in df.columns:
-                    team_data = df[df['TEAM_ABBREVIATION'].astype(str).str.upper() == resolved['abbr']]
+            # Match by TEAM_ID first (most reliable), then fall back to the abbreviation
+            row = by_id.get(resolved['team_id']) or by_abbr.get(resolved['abbr'])
 
-            if team_data.empty:
+            if row is None:
                 print(f"[team-defense] Team resolved to {resolved}, but not found in LeagueDashTeamStats output")
                 return None
 
-            row = team_data.iloc[0]
-
             def _num(col, default=np.nan):
-                if col not in team_data.columns:
+                if col not in row:
                     return default
                 try:
                     return pd.to_numeric(row[col], errors='coerce')
@@ -174,70 +251,55 @@ class NBAPlayerPropAnalyzer:
             print(f"Error fetching team defense for {resolved}: {e}")
             return None
     
-    def calculate_recent_trend(self, game_log, stat_column):
-        """Calculate weighted recent performance trend"""
-        if game_log is None or len(game_log) == 0:
+    def calculate_recent_trend(self, stats):
+        """Calculate weighted recent performance trend (stats is an array, most recent game first)"""
+        if stats is None or len(stats) == 0:
             return 0
         
-        recent_stats = game_log[stat_column].head(5).values
-        weights = np.array([0.35, 0.25, 0.20, 0.15, 0.05])[:len(recent_stats)]
-        weights = weights / weights.sum()
+        recent_stats = stats[:5]
+        weights = _TREND_WEIGHTS[:len(recent_stats)]
         
-        return np.average(recent_stats, weights=weights)
+        return recent_stats @ weights / weights.sum()
     
-    def calculate_variance(self, game_log, stat_column):
-        """Calculate statistical variance for Monte Carlo"""
-        if game_log is None or len(game_log) < 3:
+    def calculate_variance(self, stats):
+        """Calculate statistical variance for Monte Carlo (stats is an array, most recent game first)"""
+        if stats is None or len(stats) < 3:
             return 5.0  # Default variance
         
-        return game_log[stat_column].head(10).std()
+        return np.std(stats[:10], ddof=1)
     
     def engineer_features(self, player_name, opponent_team, stat_type, home_away='HOME'):
         """Engineer features for ML model"""
-        # Get recent games for trends
-        game_log_recent = self.get_player_recent_games(player_name, 15)
+        # The player log and opponent defense are independent requests, so fetch them concurrently
+        opponent_future = self._io_pool.submit(self.get_team_defense_stats, opponent_team)
         
-        # Get ALL season games for accurate season average
+        # Get ALL season games for accurate season average; recent trends use the first 15
         game_log_full = self.get_player_recent_games(player_name, None)
         
-        if game_log_recent is None or game_log_full is None:
+        if game_log_full is None:
             return None
         
         # Map stat type to NBA API columns
-        stat_mapping = {
-            'points': 'PTS',
-            'rebounds': 'REB',
-            'assists': 'AST',
-            'threes': 'FG3M',
-            'pts+rebs': ['PTS', 'REB'],
-            'pts+asts': ['PTS', 'AST'],
-            'rebs+asts': ['REB', 'AST']
-        }
-        
-        stat_col = stat_mapping.get(stat_type.lower(), 'PTS')
+        stat_cols = _STAT_MAPPING.get(stat_type.lower(), ('PTS',))
         
-        # Calculate combined stats if needed
-        if isinstance(stat_col, list):
-            game_log_recent['TARGET_STAT'] = game_log_recent[stat_col].sum(axis=1)
-            game_log_full['TARGET_STAT'] = game_log_full[stat_col].sum(axis=1)
-            stat_col = 'TARGET_STAT'
-        else:
-            game_log_recent['TARGET_STAT'] = game_log_recent[stat_col]
-            game_log_full['TARGET_STAT'] = game_log_full[stat_col]
+        # Calculate combined stats if needed, in NumPy; only the recent window gets a TARGET_STAT column
+        target = game_log_full[list(stat_cols)].to_numpy(dtype=float).sum(axis=1)
+        game_log_recent = game_log_full.head(15).assign(TARGET_STAT=target[:15])
+        stat_col = stat_cols[0] if len(stat_cols) == 1 else 'TARGET_STAT'
         
         # Feature engineering
         features = {
-            'recent_avg_5': self.calculate_recent_trend(game_log_recent, 'TARGET_STAT'),
-            'recent_avg_10': game_log_recent['TARGET_STAT'].head(10).mean(),
-            'season_avg': game_log_full['TARGET_STAT'].mean(),  # Use ALL games for season average
+            'recent_avg_5': self.calculate_recent_trend(target),
+            'recent_avg_10': target[:10].mean(),
+            'season_avg': target.mean(),  # Use ALL games for season average
             'games_played': len(game_log_full),  # Track total games played
-            'std_dev': self.calculate_variance(game_log_recent, 'TARGET_STAT'),
+            'std_dev': self.calculate_variance(target),
             'recent_min_avg': game_log_recent['MIN'].head(5).mean(),
             'home_away': 1 if home_away.upper() == 'HOME' else 0,
         }
         
         # Get opponent defensive stats
-        opponent_stats = self.get_team_defense_stats(opponent_team)
+        opponent_stats = opponent_future.result()
         if opponent_stats:
             features.update(opponent_stats)
         else:
@@ -256,7 +318,7 @@ class NBAPlayerPropAnalyzer:
             })
         
         # Form indicator (last 3 games vs season average)
-        recent_3 = game_log_recent['TARGET_STAT'].head(3).mean()
+        recent_3 = target[:3].mean()
         features['hot_cold_factor'] = (recent_3 - features['season_avg']) / (features['std_dev'] + 1)
         
         return features, game_log_recent, stat_col
@@ -280,25 +342,57 @@ class NBAPlayerPropAnalyzer:
             'sharp_money_indicator': 1 if abs(line_shift) > 1.5 else 0
         }
     
-    def run_monte_carlo_simulation(self, predicted_value, std_dev, prop_line, num_simulations=10000):
-        """Run Monte Carlo simulation to estimate probability"""
+    def simulate_betting_line_movement_batch(self, base_lines):
+        """Vectorized simulate_betting_line_movement: one draw per base line, returned as arrays"""
+        base_lines = np.asarray(base_lines, dtype=float)
+        current_lines = base_lines + self.rng.standard_normal(base_lines.shape) * 1.5
+        opening_lines = base_lines - self.rng.uniform(-2, 2, size=base_lines.shape)
+        line_shifts = current_lines - opening_lines
+        
+        return {
+            'opening_line': opening_lines,
+            'current_line': current_lines,
+            'line_movement': line_shifts,
+            'sharp_money_indicator': (np.abs(line_shifts) > 1.5).astype(int)
+        }
+    
+    def run_monte_carlo_simulation(self, predicted_value, std_dev, prop_line, num_simulations=10000, use_mc=False):
+        """Estimate over/under probabilities, exactly for the normal model or by Monte Carlo if use_mc"""
         # Add some noise to std_dev based on prediction uncertainty
         adjusted_std = std_dev * 1.1
         
-        # Run simulations
-        simulations = np.random.normal(predicted_value, adjusted_std, num_simulations)
+        if not use_mc:
+            # The outcome is Normal(predicted_value, adjusted_std), so every statistic has a closed form
+            if adjusted_std > 0:
+                over_prob = 0.5 * math.erfc((prop_line - predicted_value) / (adjusted_std * math.sqrt(2)))
+            else:
+                over_prob = float(predicted_value > prop_line)
+            half_width = 1.959963984540054 * adjusted_std  # 97.5th percentile of the standard normal
+            
+            return {
+                'over_probability': over_prob,
+                'under_probability': 1 - over_prob,
+                'expected_value': predicted_value,
+                'median_value': predicted_value,
+                'ci_95_lower': predicted_value - half_width,
+                'ci_95_upper': predicted_value + half_width,
+                'method': 'normal model'
+            }
+        
+        # Run simulations (float32 halves the buffer; the precision is plenty for these stats)
+        simulations = self.rng.standard_normal(num_simulations, dtype=np.float32)
+        simulations *= adjusted_std
+        simulations += predicted_value
         
         # Calculate probabilities
-        over_prob = (simulations > prop_line).sum() / num_simulations
+        over_prob = np.count_nonzero(simulations > prop_line) / num_simulations
         under_prob = 1 - over_prob
         
         # Calculate expected values
-        avg_simulation = simulations.mean()
-        median_simulation = np.median(simulations)
+        avg_simulation = simulations.mean(dtype=np.float64)
         
-        # Confidence intervals
-        ci_95_lower = np.percentile(simulations, 2.5)
-        ci_95_upper = np.percentile(simulations, 97.5)
+        # Median and confidence interval from a single quantile pass
+        ci_95_lower, median_simulation, ci_95_upper = np.quantile(simulations, [0.025, 0.5, 0.975])
         
         return {
             'over_probability': over_prob,
@@ -307,7 +401,33 @@ class NBAPlayerPropAnalyzer:
             'median_value': median_simulation,
             'ci_95_lower': ci_95_lower,
             'ci_95_upper': ci_95_upper,
-            'simulations': simulations
+            'method': f'{num_simulations:,} Monte Carlo iterations'
+        }
+    
+    def run_monte_carlo_batch(self, predicted_values, std_devs, prop_lines, num_simulations=10000):
+        """Run the Monte Carlo simulation for many props at once (one row of draws per prop)"""
+        # Scalars (e.g. one std dev for every prop) broadcast against the per-prop arrays
+        predicted_values, std_devs, prop_lines = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(values, dtype=float)) for values in (predicted_values, std_devs, prop_lines))
+        )
+        
+        # Single draw for every prop, scaled and shifted in place
+        simulations = self.rng.standard_normal((predicted_values.size, num_simulations))
+        simulations *= (std_devs * 1.1)[:, None]
+        simulations += predicted_values[:, None]
+        
+        over_prob = (simulations > prop_lines[:, None]).mean(axis=1)
+        ci_95_lower, median_simulation, ci_95_upper = np.percentile(simulations, [2.5, 50, 97.5], axis=1)
+        
+        # Same keys as run_monte_carlo_simulation, one entry per prop (raw draws are not returned)
+        return {
+            'over_probability': over_prob,
+            'under_probability': 1 - over_prob,
+            'expected_value': simulations.mean(axis=1),
+            'median_value': median_simulation,
+            'ci_95_lower': ci_95_lower,
+            'ci_95_upper': ci_95_upper,
+            'method': f'{num_simulations:,} Monte Carlo iterations'
         }
     
     def calculate_betting_recommendation(self, features, prop_line, betting_odds_over, betting_odds_under):
@@ -338,12 +458,6 @@ class NBAPlayerPropAnalyzer:
         mc_results = self.run_monte_carlo_simulation(predicted_value, std_dev, prop_line)
         
         # Convert American odds to decimal
-        def american_to_decimal(odds):
-            if odds > 0:
-                return (odds / 100) + 1
-            else:
-                return (100 / abs(odds)) + 1
-        
         decimal_odds_over = american_to_decimal(betting_odds_over)
         decimal_odds_under = american_to_decimal(betting_odds_under)
         
@@ -390,6 +504,34 @@ class NBAPlayerPropAnalyzer:
             recommendation['kelly_size'] = 0
         
         return recommendation
+    
+    def analyze_many(self, props):
+        """Analyze several (player, opponent, stat_type, home_away, prop_line, over_odds, under_odds) props concurrently
+        
+        Returns one recommendation per prop, or None where the player data could not be fetched.
+        """
+        props = list(props)
+        expire_caches()
+        
+        def analyze(prop):
+            player_name, opponent_team, stat_type, home_away, prop_line, over_odds, under_odds = prop
+            result = self.engineer_features(player_name, opponent_team, stat_type, home_away)
+            if result is None:
+                return None
+            return self.calculate_betting_recommendation(result[0], prop_line, over_odds, under_odds)
+        
+        # Separate from self._io_pool: each analysis blocks on fetches submitted to that pool.
+        # Requests from both pools share _FETCH_SLOTS, so the in-flight cap still holds.
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            # Fetch the league table and each distinct player once up front so the concurrent
+            # analyses below hit the caches instead of all missing them at the same moment
+            league_future = executor.submit(_league_dash_index, self.current_season)
+            list(executor.map(self.get_player_recent_games, {prop[0] for prop in props}))
+            try:
+                league_future.result()
+            except Exception:
+                pass  # get_team_defense_stats reports the failure per prop
+            return list(executor.map(analyze, props))
 
 
 class PropAnalyzerGUI:
@@ -402,8 +544,9 @@ class PropAnalyzerGUI:
         self.analyzer = NBAPlayerPropAnalyzer()
         
         # Load all NBA players for autocomplete
-        self.all_players = [player['full_name'] for player in players.get_active_players()]
-        self.all_players.sort()
+        self.all_players = _ACTIVE_PLAYER_NAMES
+        # Lower-cased once so autocomplete does not re-lower every name per keystroke
+        self._players_lower = [(player.lower(), player) for player in self.all_players]
         
         self.setup_ui()
     
@@ -513,9 +656,11 @@ class PropAnalyzerGUI:
             self.autocomplete_listbox.grid_remove()
             return
         
-        # Filter players
-        matches = [player for player in self.all_players 
-                   if typed.lower() in player.lower()][:10]  # Limit to 10 results
+        # Filter players, stopping at the first 10 results
+        typed_lower = typed.lower()
+        matches = list(itertools.islice(
+            (player for lower, player in self._players_lower if typed_lower in lower), 10
+        ))
         
         # Update listbox
         self.autocomplete_listbox.delete(0, tk.END)
@@ -546,6 +691,7 @@ class PropAnalyzerGUI:
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(tk.END, "🔄 Analyzing... Please wait...\n\n")
         self.root.update()
+        expire_caches()
         
         # Run analysis in thread to prevent GUI freezing
         thread = threading.Thread(target=self.run_analysis)
@@ -589,19 +735,21 @@ class PropAnalyzerGUI:
         """Display analysis results"""
         self.results_text.delete(1.0, tk.END)
         
-        output = f"""
-{'='*70}
+        mc = rec['mc_results']
+        rule = '=' * 70
+        parts = [f"""
+{rule}
   NBA PLAYER PROP ANALYSIS - {player_name.upper()}
-{'='*70}
+{rule}
 
 📊 PROP DETAILS:
    Stat Type: {stat_type.upper()}
    Prop Line: {prop_line}
    Player: {player_name}
    
-{'='*70}
+{rule}
 📈 STATISTICAL ANALYSIS:
-{'='*70}
+{rule}
 
 Recent Performance (Last 5 games avg): {features['recent_avg_5']:.2f}
 Recent Performance (Last 10 games avg): {features['recent_avg_10']:.2f}
@@ -613,22 +761,22 @@ Opponent Defense Rating: {features['opp_def_rating']:.1f}
 Opponent Pace: {features['opp_pace']:.1f}
 Opponent Resolved: {features.get('opp_team_abbr_resolved','')} {features.get('opp_team_name_resolved','')}
 
-{'='*70}
-🎲 MONTE CARLO SIMULATION RESULTS (10,000 iterations):
-{'='*70}
+{rule}
+🎲 OUTCOME DISTRIBUTION ({mc['method']}):
+{rule}
 
 Model Prediction: {rec['predicted_value']:.2f}
-Expected Value: {rec['mc_results']['expected_value']:.2f}
-Median Outcome: {rec['mc_results']['median_value']:.2f}
+Expected Value: {mc['expected_value']:.2f}
+Median Outcome: {mc['median_value']:.2f}
 
-95% Confidence Interval: [{rec['mc_results']['ci_95_lower']:.2f}, {rec['mc_results']['ci_95_upper']:.2f}]
+95% Confidence Interval: [{mc['ci_95_lower']:.2f}, {mc['ci_95_upper']:.2f}]
 
-Probability OVER {prop_line}: {rec['mc_results']['over_probability']*100:.1f}%
-Probability UNDER {prop_line}: {rec['mc_results']['under_probability']*100:.1f}%
+Probability OVER {prop_line}: {mc['over_probability']*100:.1f}%
+Probability UNDER {prop_line}: {mc['under_probability']*100:.1f}%
 
-{'='*70}
+{rule}
 💰 BETTING EDGE ANALYSIS:
-{'='*70}
+{rule}
 
 Edge on OVER: {rec['edge_over']*100:+.2f}%
 Edge on UNDER: {rec['edge_under']*100:+.2f}%
@@ -636,36 +784,36 @@ Edge on UNDER: {rec['edge_under']*100:+.2f}%
 Kelly Criterion Bet Size (OVER): {rec['kelly_over']*100:.2f}% of bankroll
 Kelly Criterion Bet Size (UNDER): {rec['kelly_under']*100:.2f}% of bankroll
 
-{'='*70}
+{rule}
 🎯 RECOMMENDATION:
-{'='*70}
+{rule}
 
-"""
+"""]
         
         if rec['bet'] == 'OVER':
-            output += f"""
+            parts.append(f"""
 ✅ BET: OVER {prop_line}
 💪 Confidence: {'⭐' * int(rec['confidence'])} ({rec['confidence']:.1f}/5.0)
 📊 Edge: {rec['edge']*100:.2f}%
 💵 Suggested Bet Size: {rec['kelly_size']*100:.2f}% of bankroll
 
 REASONING: Model predicts {rec['predicted_value']:.2f}, which is {rec['predicted_value']-prop_line:.2f} 
-points above the line. Monte Carlo simulation shows {rec['mc_results']['over_probability']*100:.1f}% 
+points above the line. The outcome distribution shows {mc['over_probability']*100:.1f}% 
 probability of hitting the OVER with positive expected value.
-"""
+""")
         elif rec['bet'] == 'UNDER':
-            output += f"""
+            parts.append(f"""
 ✅ BET: UNDER {prop_line}
 💪 Confidence: {'⭐' * int(rec['confidence'])} ({rec['confidence']:.1f}/5.0)
 📊 Edge: {rec['edge']*100:.2f}%
 💵 Suggested Bet Size: {rec['kelly_size']*100:.2f}% of bankroll
 
 REASONING: Model predicts {rec['predicted_value']:.2f}, which is {prop_line-rec['predicted_value']:.2f} 
-points below the line. Monte Carlo simulation shows {rec['mc_results']['under_probability']*100:.1f}% 
+points below the line. The outcome distribution shows {mc['under_probability']*100:.1f}% 
 probability of hitting the UNDER with positive expected value.
-"""
+""")
         else:
-            output += f"""
+            parts.append(f"""
 ⚠️  NO BET RECOMMENDED
 📊 Insufficient Edge
 
@@ -673,24 +821,25 @@ The model does not identify sufficient edge (>5%) on either side of this bet.
 Best edge found: {max(rec['edge_over'], rec['edge_under'])*100:.2f}%
 
 Consider passing on this prop or waiting for better lines.
-"""
+""")
         
-        output += f"""
-{'='*70}
+        parts.append(f"""
+{rule}
 📋 LAST 5 GAMES:
-{'='*70}
+{rule}
 
-"""
+""")
         
-        for idx, row in game_log.head(5).iterrows():
-            output += f"  {row['GAME_DATE']}: {row[stat_col]:.0f} vs {row['MATCHUP']}\n"
+        last_5 = game_log.head(5)
+        for game_date, stat_value, matchup in zip(last_5['GAME_DATE'], last_5[stat_col], last_5['MATCHUP']):
+            parts.append(f"  {game_date}: {stat_value:.0f} vs {matchup}\n")
         
-        output += f"\n{'='*70}\n"
-        output += "⚠️  DISCLAIMER: This is for educational purposes. Gambling involves risk.\n"
-        output += "    Always bet responsibly and within your means.\n"
-        output += f"{'='*70}\n"
+        parts.append(f"\n{rule}\n")
+        parts.append("⚠️  DISCLAIMER: This is for educational purposes. Gambling involves risk.\n")
+        parts.append("    Always bet responsibly and within your means.\n")
+        parts.append(f"{rule}\n")
         
-        self.results_text.insert(tk.END, output)
+        self.results_text.insert(tk.END, "".join(parts))
 
 
 def main():